@@ -1,12 +1,13 @@
+import functools
 import logging
 import operator
 from typing import NamedTuple
-from fontTools.misc.transform import Transform
 from fontTools.pens.filterPen import FilterPointPen
 from fontTools.pens.pointPen import PointToSegmentPen, SegmentToPointPen
 from fontTools.pens.recordingPen import RecordingPointPen
 from fontTools.ufoLib.glifLib import readGlyphFromString
-from fontTools.varLib.models import normalizeValue
+from fontTools.varLib.models import VariationModel, normalizeValue
+from .utils import tuplifyLocation
 
 
 logger = logging.getLogger(__name__)
@@ -125,8 +126,13 @@ class Glyph(_MathMixin):
         if self.model is None:
             return self  # XXX raise error?
         if self.deltas is None:
+            # This also raises InterpolationError for incompatible masters
             self.deltas = self.model.getDeltas([self] + self.variations)
         location = normalizeLocation(location, self.combinedAxes)
+        if not any(location.values()):
+            # At the default location only the default master contributes,
+            # with a scalar of 1.0: skip computing the scalars
+            return self * 1.0
         return self.model.interpolateFromDeltas(location, self.deltas)
 
     def _doBinaryOperatorScalar(self, scalar, op):
@@ -169,6 +175,18 @@ def normalizeLocation(location, axes):
     }
 
 
+def getVariationModel(locations):
+    """Return a VariationModel for the master locations. Glyphs with the same
+    master locations share the same model object.
+    """
+    return _getVariationModel(tuple(tuplifyLocation(loc) for loc in locations))
+
+
+@functools.lru_cache(maxsize=1024)
+def _getVariationModel(locationsKey):
+    return VariationModel([dict(loc) for loc in locationsKey])
+
+
 class Component(NamedTuple):
     name: str
     coord: dict
@@ -234,20 +252,29 @@ class MathOutline(RecordingPointPen, _MathMixin):
         self.drawPoints(PointToSegmentPen(pen))
 
     def transform(self, t):
-        if not hasattr(t, "transformPoint"):
-            t = Transform(*t)
-        return self.applyUnaryFunc(t.transformPoint)
+        # Same math as Transform.transformPoint(), without the method call
+        # and attribute lookups per point
+        xx, xy, yx, yy, dx, dy = t
+        if (xx, xy, yx, yy) == (1, 0, 0, 1):
+            # Many components are only offset: skip the multiplications
+            return self.applyUnaryFunc(lambda pt: (pt[0] + dx, pt[1] + dy))
+
+        def transformPoint(pt):
+            x, y = pt
+            return (xx * x + yx * y + dx, xy * x + yy * y + dy)
+
+        return self.applyUnaryFunc(transformPoint)
 
     def applyUnaryFunc(self, func):
+        # Build the recording directly, instead of calling the pen methods
         result = MathOutline()
+        value = result.value
         for m, args, kwargs in self.value:
             if m == "addPoint":
                 pt, seg, smooth, name = args
-                result.addPoint(func(pt), seg, smooth, name, **kwargs)
-            elif m == "beginPath":
-                result.beginPath()
-            elif m == "endPath":
-                result.endPath()
+                value.append((m, (func(pt), seg, smooth, name), dict(kwargs)))
+            elif m == "beginPath" or m == "endPath":
+                value.append((m, (), {}))
             else:
                 assert False, f"unsupported method: {m}"
         return result
@@ -10,7 +10,7 @@ from fontTools.misc.fixedTools import otRound
 from fontTools.pens.roundingPen import RoundingPointPen
 from fontTools.pens.pointPen import PointToSegmentPen, SegmentToPointPen
 from fontTools.ufoLib.filenames import userNameToFileName
-from fontTools.varLib.models import VariationModel, normalizeLocation
+from fontTools.varLib.models import normalizeLocation
 
 try:
     from ufo2ft.constants import FILTERS_KEY
@@ -19,7 +19,14 @@ except ImportError:
     from ufo2ft.filters import UFO2FT_FILTERS_KEY as FILTERS_KEY
 from ufoLib2.objects import Font as UFont, Glyph as UGlyph
 
-from .objects import Component, Glyph, InterpolationError, MathDict, MathOutline
+from .objects import (
+    Component,
+    Glyph,
+    InterpolationError,
+    MathDict,
+    MathOutline,
+    getVariationModel,
+)
 from .utils import decomposeTwoByTwo, makeTransform
 
 
@@ -632,6 +639,7 @@ class GlyphSet:
         self._glyphs = {}
         self._layers = {}
         self._revCmap = None
+        self._fileNames = None
 
     def getGlyphNamesAndUnicodes(self):
         if self._revCmap is None:
@@ -651,8 +659,21 @@ class GlyphSet:
         if glyphName in self._glyphs:
             return True
         fileName = userNameToFileName(glyphName, suffix=".glif")
-        glyphPath = self._path / fileName
-        return glyphPath.exists()
+        if fileName in self._getFileNames():
+            return True
+        # Not in the snapshot: the file may have been added since, or the file
+        # system may be case-insensitive. Check the same way getGlyphRaw() does.
+        return (self._path / fileName).exists()
+
+    def _getFileNames(self):
+        # List the directory once, so that most lookups for existing glyphs
+        # don't need a file system call
+        if self._fileNames is None:
+            if self._path.is_dir():
+                self._fileNames = {p.name for p in self._path.iterdir()}
+            else:
+                self._fileNames = set()
+        return self._fileNames
 
     def getGlyph(self, glyphName):
         glyph = self._glyphs.get(glyphName)
@@ -815,7 +836,7 @@ class RCJKGlyph(Glyph):
             normalizeLocation(variation.location, self.combinedAxes)
             for variation in self.variations
         ]
-        self.model = VariationModel(locations)
+        self.model = getVariationModel(locations)
 
 
 def _unpackDeepComponent(dc, name=None):
@@ -1,6 +1,7 @@
 from ast import literal_eval
 from collections import UserDict
 import functools
+import operator
 import struct
 from typing import NamedTuple
 from fontTools.misc.fixedTools import (
@@ -22,7 +23,12 @@ HAS_TRANSFORM_VARIATIONS = 1 << 4
 _FIRST_TRANSFORM_FIELD_BIT = 5
 
 COORD_PRECISIONBITS = 12
-fixedCoord = functools.partial(floatToFixed, precisionBits=COORD_PRECISIONBITS)
+# The same coordinate and transform values occur over and over again in
+# a font, so the float -> int converters are memoized
+_CONVERTER_CACHE_SIZE = 4096
+fixedCoord = functools.lru_cache(maxsize=_CONVERTER_CACHE_SIZE)(
+    functools.partial(floatToFixed, precisionBits=COORD_PRECISIONBITS)
+)
 strToFixedCoordToFloat = functools.partial(
     strToFixedToFloat, precisionBits=COORD_PRECISIONBITS
 )
@@ -58,13 +64,16 @@ transformDefaults = {
 DEGREES_SCALE = 0x8000 / (4 * 360)
 
 
+@functools.lru_cache(maxsize=_CONVERTER_CACHE_SIZE)
 def degreesToInt(value):
     # Fit the range -360..360 into -32768..32768
+    if -360 < value < 360:
+        return otRound(value * DEGREES_SCALE)
     # If angle is outside the range, force it into the range
     if value >= 360:
         # print("warning, angle out of range:", value)
         value %= 360
-    elif value <= -360:
+    else:
         # print("warning, angle out of range:", value)
         value %= -360
     return otRound(value * DEGREES_SCALE)
@@ -190,11 +199,38 @@ class table_VarC(DefaultTable):
 
         varStoreOffset = reader.readULong()
         if varStoreOffset:
-            self.VarStore = VarStore()
-            self.VarStore.decompile(reader.getSubReader(varStoreOffset), ttFont)
+            # The VarStore gets decompiled upon first access, see __getattr__
+            self._lazyVarStore = reader.getSubReader(varStoreOffset), ttFont
         else:
             self.VarStore = None
 
+    def __getattr__(self, attr):
+        if attr == "VarStore" and self._ensureVarStore():
+            return self.VarStore
+        raise AttributeError(attr)
+
+    def _ensureVarStore(self):
+        # Decompile the VarStore if that is still pending. Returns whether
+        # it was.
+        lazyVarStore = self.__dict__.pop("_lazyVarStore", None)
+        if lazyVarStore is None:
+            return False
+        reader, ttFont = lazyVarStore
+        self.VarStore = VarStore()
+        self.VarStore.decompile(reader, ttFont)
+        return True
+
+    def __eq__(self, other):
+        if type(self) is not type(other):
+            return NotImplemented
+        # A lazily loaded table must compare equal to a fully loaded one
+        self._ensureVarStore()
+        other._ensureVarStore()
+        return self._publicAttributes() == other._publicAttributes()
+
+    def _publicAttributes(self):
+        return {k: v for k, v in self.__dict__.items() if not k.startswith("_")}
+
     def compile(self, ttFont):
         from fontTools.ttLib.tables.otConverters import OTTableWriter
 
@@ -209,10 +245,19 @@ class table_VarC(DefaultTable):
         glyphData = self.GlyphData
         glyphOrder = ttFont.getGlyphOrder()
 
-        numGlyphs = 0
-        for glyphID, glyphName in enumerate(glyphOrder):
-            if glyphName in glyphData:
-                numGlyphs = max(numGlyphs, glyphID + 1)
+        # Many glyphs share identical components, only compile those once
+        componentCache = {}
+
+        # numGlyphs is one more than the highest glyph ID that has VarC data
+        reverseGlyphMap = ttFont.getReverseGlyphMap()
+        numGlyphs = max(
+            (
+                reverseGlyphMap[glyphName] + 1
+                for glyphName in glyphData
+                if glyphName in reverseGlyphMap
+            ),
+            default=0,
+        )
 
         writer.writeUShort(numGlyphs)  # numGlyphs <= maxp.numGlyphs
         for glyphID in range(numGlyphs):
@@ -227,7 +272,7 @@ class table_VarC(DefaultTable):
                     len(glyfGlyph.components),
                 )
                 sub = _getSubWriter(writer)
-                compileGlyph(sub, components, axisTags, axisTagToIndex)
+                compileGlyph(sub, components, axisTags, axisTagToIndex, componentCache)
             else:
                 writer.writeULong(0x00000000)
 
@@ -275,35 +320,33 @@ class table_VarC(DefaultTable):
                 )
                 writer.newline()
 
-                for axisName, valueDict in sorted(varcComponent.coord.items()):
-                    attrs = [
-                        ("axis", axisName),
-                        (
-                            "value",
-                            floatToFixedToStr(valueDict["value"], COORD_PRECISIONBITS),
-                        ),
-                    ]
-                    if "varIdx" in valueDict:
-                        outer, inner = splitVarIdx(valueDict["varIdx"])
-                        attrs.extend([("outer", outer), ("inner", inner)])
-                    writer.simpletag("Coord", attrs)
+                for axisName, valueDict in sorted(
+                    varcComponent.coord.items(), key=_itemKey
+                ):
+                    value = floatToFixedToStr(valueDict["value"], COORD_PRECISIONBITS)
+                    writer.simpletag(
+                        "Coord",
+                        [("axis", axisName), ("value", value)]
+                        + _varIdxAttrs(valueDict),
+                    )
                     writer.newline()
 
                 scalePrecisionBits = 16 - varcComponent.numIntBitsForScale
 
+                # The transform fields are normally already in sorted order,
+                # making this sort a linear scan
                 for transformFieldName, valueDict in sorted(
-                    varcComponent.transform.items()
+                    varcComponent.transform.items(), key=_itemKey
                 ):
                     value = valueDict["value"]
                     if transformFieldName in {"ScaleX", "ScaleY"}:
                         value = floatToFixedToStr(value, scalePrecisionBits)
                     elif transformFieldName in {"Rotation", "SkewX", "SkewY"}:
                         value = degreestToIntToStr(value)
-                    attrs = [("value", value)]
-                    if "varIdx" in valueDict:
-                        outer, inner = splitVarIdx(valueDict["varIdx"])
-                        attrs.extend([("outer", outer), ("inner", inner)])
-                    writer.simpletag(transformFieldName, attrs)
+                    writer.simpletag(
+                        transformFieldName,
+                        [("value", value)] + _varIdxAttrs(valueDict),
+                    )
                     writer.newline()
 
                 writer.endtag("Component")
@@ -343,9 +386,7 @@ def _glyph_fromXML(name, attrs, content, ttFont):
 def _component_fromXML(name, attrs, content, ttFont):
     assert name == "Component"
     numIntBitsForScale = literal_eval(attrs["numIntBitsForScale"])
-    scaleConverter = functools.partial(
-        strToFixedToFloat, precisionBits=16 - numIntBitsForScale
-    )
+    scaleConverter = getStrToFloatConverterForNumIntBitsForScale(numIntBitsForScale)
     coord = dict()
     transform = dict()
     for name, attrs, content in _filterContent(content):
@@ -377,6 +418,18 @@ def _makeValueDict(attrs, converter=None):
     return valueDict
 
 
+# Keys are unique, so sorting on the key alone gives the same order as sorting
+# the (key, valueDict) tuples, without the tuple comparisons
+_itemKey = operator.itemgetter(0)
+
+
+def _varIdxAttrs(valueDict):
+    if VARIDX_KEY not in valueDict:
+        return []
+    outer, inner = splitVarIdx(valueDict[VARIDX_KEY])
+    return [("outer", outer), ("inner", inner)]
+
+
 def _filterContent(content):
     return [item for item in content if isinstance(item, tuple)]
 
@@ -389,140 +442,250 @@ def splitVarIdx(value):
 # Compile
 
 
-def compileGlyph(writer, components, axisTags, axisTagToIndex):
+_flagsAndByteNumAxesStruct = struct.Struct(">HB")
+_flagsAndWordNumAxesStruct = struct.Struct(">HH")
+_singleByteAxisCoordStruct = struct.Struct(">Bh")
+_singleWordAxisCoordStruct = struct.Struct(">Hh")
+_transformStructs = [
+    struct.Struct(">" + "h" * numFields)
+    for numFields in range(len(transformFieldNames) + 1)
+]
+_transformFieldsToInt = [
+    (fieldName, transformFieldFlags[fieldName], transformToIntConverters[fieldName])
+    for fieldName in transformFieldNames
+]
+
+
+@functools.lru_cache(maxsize=None)
+def _getArrayStruct(formatChar, count):
+    return struct.Struct(">" + formatChar * count)
+
+
+@functools.lru_cache(maxsize=None)
+def _getCoordsStruct(axisIndexFormatChar, numAxes):
+    # axis indices, followed by the axis values
+    return struct.Struct(">" + axisIndexFormatChar * numAxes + "h" * numAxes)
+
+
+@functools.lru_cache(maxsize=None)
+def _getVarIdxsStruct(entryFormatChar, count):
+    # entryFormat byte, followed by the entries
+    return struct.Struct(">B" + entryFormatChar * count)
+
+
+def compileGlyph(writer, components, axisTags, axisTagToIndex, componentCache=None):
+    if componentCache is None:
+        componentCache = {}
+    # All components of the glyph are accumulated in a single buffer
+    data = bytearray()
     for component in components:
-        compileComponent(writer, component, axisTags, axisTagToIndex)
+        key = _getComponentKey(component)
+        componentData = componentCache.get(key)
+        if componentData is None:
+            componentData = bytearray()
+            _compileComponent(componentData, component, axisTags, axisTagToIndex)
+            componentData = componentCache[key] = bytes(componentData)
+        data += componentData
+    writer.writeData(bytes(data))
+
+
+def _getComponentKey(component):
+    return (
+        component.numIntBitsForScale,
+        tuple(
+            (axisName, valueDict["value"], valueDict.get(VARIDX_KEY))
+            for axisName, valueDict in component.coord.items()
+        ),
+        tuple(
+            (fieldName, valueDict["value"], valueDict.get(VARIDX_KEY))
+            for fieldName, valueDict in component.transform.items()
+        ),
+    )
 
 
 def compileComponent(writer, component, axisTags, axisTagToIndex):
+    data = bytearray()
+    _compileComponent(data, component, axisTags, axisTagToIndex)
+    writer.writeData(bytes(data))
+
+
+def _compileComponent(data, component, axisTags, axisTagToIndex):
     flags = component.numIntBitsForScale
     assert flags == flags & NUM_INT_BITS_FOR_SCALE_MASK
 
     numAxes = len(component.coord)
-    coordFlags, coordData, coordVarIdxs = _compileCoords(
-        component.coord, axisTags, axisTagToIndex
-    )
+    # The coord and transform varIdxs are appended to the same list
+    varIdxs = []
+    coordFlags, coordData = _compileCoords(component.coord, axisTagToIndex, varIdxs)
     flags |= coordFlags
 
-    transformFlags, transformData, transformVarIdxs = _compileTransform(
-        component.transform, component.numIntBitsForScale
+    transformFlags, transformData = _compileTransform(
+        component.transform, component.numIntBitsForScale, varIdxs
     )
     flags |= transformFlags
-    varIdxs = coordVarIdxs + transformVarIdxs
 
-    writer.writeUShort(flags)
     if flags & AXIS_INDICES_ARE_WORDS:
-        writer.writeUShort(numAxes)
+        data += _flagsAndWordNumAxesStruct.pack(flags, numAxes)
     else:
-        writer.writeUInt8(numAxes)
+        data += _flagsAndByteNumAxesStruct.pack(flags, numAxes)
 
-    writer.writeData(coordData)
-    writer.writeData(transformData)
-    compileVarIdxs(writer, varIdxs)
+    data += coordData
+    data += transformData
+    data += _packVarIdxs(varIdxs)
 
 
-def _compileCoords(coordDict, axisTags, axisTagToIndex):
+def _compileCoords(coordDict, axisTagToIndex, varIdxs):
+    if not coordDict:
+        return 0, b""
+    if len(coordDict) == 1:
+        return _compileSingleCoord(coordDict, axisTagToIndex, varIdxs)
     coordFlags = 0
-    axisIndices = sorted(axisTagToIndex[k] for k in coordDict)
-    numAxes = len(axisIndices)
-    if numAxes and max(axisIndices) > 127:
-        axisIndexFormat = ">" + "H" * numAxes
+    # Axis indices are unique, so the value dicts never get compared
+    coordItems = sorted(
+        (axisTagToIndex[axisName], valueDict)
+        for axisName, valueDict in coordDict.items()
+    )
+    numAxes = len(coordItems)
+    if coordItems[-1][0] > 127:
+        axisIndexFormatChar = "H"
         coordFlags |= AXIS_INDICES_ARE_WORDS
         maxAxisIndex = 0x7FFF
         hasVarIdxFlag = 0x8000
     else:
-        axisIndexFormat = ">" + "B" * numAxes
+        axisIndexFormatChar = "B"
         maxAxisIndex = 0x7F
         hasVarIdxFlag = 0x80
 
+    axisIndices = []
     coordValues = []
-    coordVarIdxs = []
-    for i, axisIndex in enumerate(axisIndices):
+    for axisIndex, valueDict in coordItems:
         assert axisIndex <= maxAxisIndex
-        axisName = axisTags[axisIndex]
-        valueDict = coordDict[axisName]
         coordValues.append(fixedCoord(valueDict["value"]))
         if VARIDX_KEY in valueDict:
-            coordVarIdxs.append(valueDict[VARIDX_KEY])
-            axisIndices[i] |= hasVarIdxFlag
+            varIdxs.append(valueDict[VARIDX_KEY])
+            axisIndex |= hasVarIdxFlag
+        axisIndices.append(axisIndex)
+
+    coordStruct = _getCoordsStruct(axisIndexFormatChar, numAxes)
+    coordData = coordStruct.pack(*axisIndices, *coordValues)
+    return coordFlags, coordData
+
+
+def _compileSingleCoord(coordDict, axisTagToIndex, varIdxs):
+    # Fast path for the common case of a component that only has a single
+    # axis: the axis index and the value can be packed in one go.
+    ((axisName, valueDict),) = coordDict.items()
+    axisIndex = axisTagToIndex[axisName]
+    if axisIndex > 127:
+        coordFlags = AXIS_INDICES_ARE_WORDS
+        coordStruct = _singleWordAxisCoordStruct
+        maxAxisIndex = 0x7FFF
+        hasVarIdxFlag = 0x8000
+    else:
+        coordFlags = 0
+        coordStruct = _singleByteAxisCoordStruct
+        maxAxisIndex = 0x7F
+        hasVarIdxFlag = 0x80
+    assert axisIndex <= maxAxisIndex
 
-    axisIndicesData = struct.pack(axisIndexFormat, *axisIndices)
-    axisValuesData = struct.pack(">" + "h" * numAxes, *coordValues)
-    return coordFlags, axisIndicesData + axisValuesData, coordVarIdxs
+    if VARIDX_KEY in valueDict:
+        varIdxs.append(valueDict[VARIDX_KEY])
+        axisIndex |= hasVarIdxFlag
 
+    coordData = coordStruct.pack(axisIndex, fixedCoord(valueDict["value"]))
+    return coordFlags, coordData
 
-def _compileTransform(transformDict, numIntBitsForScale):
+
+def _compileTransform(transformDict, numIntBitsForScale, varIdxs):
+    if not transformDict:
+        return 0, b""
     transformFlags = 0
-    hasTransformVariations = transformDict and VARIDX_KEY in next(
-        iter(transformDict.values())
-    )
+    hasTransformVariations = VARIDX_KEY in next(iter(transformDict.values()))
     if hasTransformVariations:
         transformFlags |= HAS_TRANSFORM_VARIATIONS
 
     scaleConverter = getToFixedConverterForNumIntBitsForScale(numIntBitsForScale)
 
     transformValues = []
-    transformVarIdxs = []
-    for fieldName in transformFieldNames:
+    for fieldName, fieldFlag, convert in _transformFieldsToInt:
         valueDict = transformDict.get(fieldName)
         if valueDict is None:
             continue
-        convert = transformToIntConverters[fieldName]
         if convert is None:
             assert fieldName in {"ScaleX", "ScaleY"}
             convert = scaleConverter
-        transformFlags |= transformFieldFlags[fieldName]
+        transformFlags |= fieldFlag
         transformValues.append(convert(valueDict["value"]))
         if hasTransformVariations:
-            transformVarIdxs.append(valueDict[VARIDX_KEY])
+            varIdxs.append(valueDict[VARIDX_KEY])
 
-    transformData = struct.pack(">" + "h" * len(transformValues), *transformValues)
-    return transformFlags, transformData, transformVarIdxs
+    transformData = _transformStructs[len(transformValues)].pack(*transformValues)
+    return transformFlags, transformData
 
 
 def compileVarIdxs(writer, varIdxs):
+    writer.writeData(_packVarIdxs(varIdxs))
+
+
+def _packVarIdxs(varIdxs):
     # Mostly taken from fontTools.ttLib.tables.otTables.VarIdxMap.preWrite()
-    ored = 0
-    for idx in varIdxs:
-        ored |= idx
-
-    inner = ored & 0xFFFF
-    innerBits = 0
-    while inner:
-        innerBits += 1
-        inner >>= 1
-    innerBits = max(innerBits, 1)
+    ored = functools.reduce(operator.or_, varIdxs, 0)
+
+    innerBits = max((ored & 0xFFFF).bit_length(), 1)
     assert innerBits <= 16
     innerMask = (1 << innerBits) - 1
     outerMask = 0xFFFFFFFF - innerMask
+    # If no varIdx uses an outer index, the entries are the varIdxs themselves
+    needsRemapping = bool(ored & outerMask)
 
     ored = (ored >> (16 - innerBits)) | (ored & ((1 << innerBits) - 1))
     if ored <= 0x000000FF:
         entrySize = 1
-        write = writer.writeUInt8
+        entryFormatChar = "B"
     elif ored <= 0x0000FFFF:
         entrySize = 2
-        write = writer.writeUShort
+        entryFormatChar = "H"
     elif ored <= 0x00FFFFFF:
         entrySize = 3
-        write = writer.writeUInt24
+        entryFormatChar = None
     else:
         entrySize = 4
-        write = writer.writeULong
+        entryFormatChar = "L"
 
     entryFormat = ((entrySize - 1) << 4) | (innerBits - 1)
-    writer.writeUInt8(entryFormat)
     outerShift = 16 - innerBits
-    varIdxInts = [
-        ((idx & outerMask) >> outerShift) | (idx & innerMask) for idx in varIdxs
-    ]
-    for value in varIdxInts:
-        write(value)
+    if needsRemapping:
+        varIdxInts = [
+            ((idx & outerMask) >> outerShift) | (idx & innerMask) for idx in varIdxs
+        ]
+    else:
+        varIdxInts = varIdxs
+    if entryFormatChar is None:
+        return bytes([entryFormat]) + packArrayUInt24(varIdxInts)
+    varIdxsStruct = _getVarIdxsStruct(entryFormatChar, len(varIdxInts))
+    return varIdxsStruct.pack(entryFormat, *varIdxInts)
+
+
+def packArrayUInt24(values):
+    # Pack as 4-byte records, then drop the high byte of each record
+    count = len(values)
+    data = _getArrayStruct("L", count).pack(*values)
+    packed = bytearray(3 * count)
+    packed[0::3] = data[1::4]
+    packed[1::3] = data[2::4]
+    packed[2::3] = data[3::4]
+    return bytes(packed)
 
 
 # Decompile
 
 
+_transformFieldsFromInt = [
+    (fieldName, transformFieldFlags[fieldName], transformFromIntConverters[fieldName])
+    for fieldName in transformFieldNames
+]
+
+
 def decompileGlyph(reader, glyfGlyph, axisTags):
     assert glyfGlyph.isComposite()
     numComponents = len(glyfGlyph.components)
@@ -552,38 +715,41 @@ def decompileComponent(reader, axisTags):
     axisHasVarIdx = [bool(axisIndex & hasVarIdxFlag) for axisIndex in axisIndices]
     axisIndices = [axisIndex & axisIndexMask for axisIndex in axisIndices]
 
+    coordValues = reader.readArray("h", 2, numAxes)
     coord = [
-        (axisTags[i], dict(value=fixedToFloat(reader.readShort(), COORD_PRECISIONBITS)))
-        for i in axisIndices
+        (axisTags[i], {"value": fixedToFloat(value, COORD_PRECISIONBITS)})
+        for i, value in zip(axisIndices, coordValues)
     ]
     numVarIdxs = sum(axisHasVarIdx)
 
-    transform = []
-    for fieldName, mask in transformFieldFlags.items():
-        if not (flags & mask):
-            continue
-        value = reader.readShort()
+    transformFields = [
+        (fieldName, convert)
+        for fieldName, fieldFlag, convert in _transformFieldsFromInt
+        if flags & fieldFlag
+    ]
+    transformValues = reader.readArray("h", 2, len(transformFields))
 
-        convert = transformFromIntConverters[fieldName]
+    transform = []
+    for (fieldName, convert), value in zip(transformFields, transformValues):
         if convert is None:
             assert fieldName in {"ScaleX", "ScaleY"}
             convert = scaleConverter
-        transform.append((fieldName, dict(value=convert(value))))
+        transform.append((fieldName, {"value": convert(value)}))
 
     if flags & HAS_TRANSFORM_VARIATIONS:
         numVarIdxs += len(transform)
 
-    varIdxs = decompileVarIdxs(reader, numVarIdxs)
+    varIdxs = iter(decompileVarIdxs(reader, numVarIdxs))
     assert len(axisHasVarIdx) == len(coord)
     for hasVarIdx, (axisTag, valueDict) in zip(axisHasVarIdx, coord):
         if hasVarIdx:
-            valueDict[VARIDX_KEY] = varIdxs.pop(0)
+            valueDict[VARIDX_KEY] = next(varIdxs)
 
     if flags & HAS_TRANSFORM_VARIATIONS:
         for fieldName, valueDict in transform:
-            valueDict[VARIDX_KEY] = varIdxs.pop(0)
+            valueDict[VARIDX_KEY] = next(varIdxs)
 
-    assert not varIdxs
+    assert next(varIdxs, None) is None
 
     return ComponentRecord(dict(coord), dict(transform), numIntBitsForScale)
 
@@ -600,11 +766,14 @@ def decompileVarIdxs(reader, count):
     elif entrySize == 2:
         varIdxs = reader.readArray("H", 2, count)
     elif entrySize == 3:
-        varIdxs = [reader.readUInt24() for i in range(count)]
+        varIdxs = _readUInt24Array(reader, count)
     elif entrySize == 4:
         varIdxs = reader.readArray("I", 4, count)
     else:
         assert False, "oops"
+    if not varIdxs or max(varIdxs) <= innerMask:
+        # No entry has an outer index, the entries are the varIdxs themselves
+        return list(varIdxs)
     varIdxs = [
         (varIdx & innerMask) + ((varIdx & outerMask) << outerShift)
         for varIdx in varIdxs
@@ -612,12 +781,49 @@ def decompileVarIdxs(reader, count):
     return varIdxs
 
 
+def _readUInt24Array(reader, count):
+    # Expand the 3-byte records to 4-byte records, so we can unpack them
+    # all with a single struct call
+    data = reader.readData(3 * count)
+    padded = bytearray(4 * count)
+    padded[1::4] = data[0::3]
+    padded[2::4] = data[1::3]
+    padded[3::4] = data[2::3]
+    return struct.unpack(f">{count}I", padded)
+
+
 # Helpers
 
 
+# numIntBits can only be 0..7, so all converters are created up front
+
+_NUM_INT_BITS_VALUES = range(NUM_INT_BITS_FOR_SCALE_MASK + 1)
+
+_toFixedScaleConverters = tuple(
+    functools.lru_cache(maxsize=_CONVERTER_CACHE_SIZE)(
+        functools.partial(floatToFixed, precisionBits=16 - numIntBits)
+    )
+    for numIntBits in _NUM_INT_BITS_VALUES
+)
+
+_toFloatScaleConverters = tuple(
+    functools.partial(fixedToFloat, precisionBits=16 - numIntBits)
+    for numIntBits in _NUM_INT_BITS_VALUES
+)
+
+_strToFloatScaleConverters = tuple(
+    functools.partial(strToFixedToFloat, precisionBits=16 - numIntBits)
+    for numIntBits in _NUM_INT_BITS_VALUES
+)
+
+
 def getToFixedConverterForNumIntBitsForScale(numIntBits):
-    return functools.partial(floatToFixed, precisionBits=16 - numIntBits)
+    return _toFixedScaleConverters[numIntBits]
 
 
 def getToFloatConverterForNumIntBitsForScale(numIntBits):
-    return functools.partial(fixedToFloat, precisionBits=16 - numIntBits)
+    return _toFloatScaleConverters[numIntBits]
+
+
+def getStrToFloatConverterForNumIntBitsForScale(numIntBits):
+    return _strToFloatScaleConverters[numIntBits]
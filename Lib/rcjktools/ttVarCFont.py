@@ -1,3 +1,4 @@
+import functools
 from fontTools.pens.transformPen import TransformPen
 from fontTools.ttLib import TTFont
 from fontTools.ttLib.tables._g_l_y_f import GlyphCoordinates
@@ -6,7 +7,7 @@ from fontTools.varLib.models import normalizeLocation, supportScalar
 from fontTools.varLib.varStore import VarStoreInstancer
 import uharfbuzz as hb
 from rcjktools.table_VarC import COORD_PRECISIONBITS, VARIDX_KEY, intToDegrees
-from rcjktools.utils import makeTransformVarCo
+from rcjktools.utils import makeTransformVarCo, tuplifyLocation
 
 
 class TTVarCFont:
@@ -28,6 +29,14 @@ class TTVarCFont:
             with open(path, "rb") as f:
                 face = hb.Face(f.read())
             self.hbFont = hb.Font(face)
+        # The same glyph is often drawn at the same location, for example when
+        # it is used as a component by several other glyphs
+        self._getNormalizedLocation = functools.lru_cache(maxsize=4096)(
+            self._normalizeLocation
+        )
+        self._getComponentOffsets = functools.lru_cache(maxsize=4096)(
+            self._instantiateComponentOffsets
+        )
 
     def keys(self):
         return self.ttFont.getGlyphNames()
@@ -36,26 +45,35 @@ class TTVarCFont:
         return glyphName in self.ttFont.getReverseGlyphMap()
 
     def drawGlyph(self, pen, glyphName, location):
-        normLocation = normalizeLocation(location, self.axes)
-        fvarTable = self.ttFont["fvar"]
+        # Look up the tables once, not again for every nested component
+        fvarAxes = self.ttFont["fvar"].axes
         glyfTable = self.ttFont["glyf"]
         varcTable = self.ttFont.get("VarC")
-        if varcTable is not None:
-            glyphData = varcTable.GlyphData
-        else:
-            glyphData = {}
+        glyphData = varcTable.GlyphData if varcTable is not None else {}
+        self._drawGlyph(
+            pen, glyphName, location, fvarAxes, glyfTable, glyphData, varcTable
+        )
 
+    def _drawGlyph(
+        self, pen, glyphName, location, fvarAxes, glyfTable, glyphData, varcTable
+    ):
+        normLocation, normLocationKey = self._getNormalizedLocation(
+            tuplifyLocation(location)
+        )
         g = glyfTable[glyphName]
         varComponents = glyphData.get(glyphName)
         if g.isComposite():
-            componentOffsets = instantiateComponentOffsets(
-                self.ttFont, glyphName, normLocation
-            )
+            componentOffsets = self._getComponentOffsets(glyphName, normLocationKey)
             if varComponents is not None:
                 assert len(g.components) == len(varComponents)
-                varcInstancer = VarStoreInstancer(
-                    varcTable.VarStore, fvarTable.axes, normLocation
-                )
+                if any(normLocation.values()):
+                    # Only access VarStore here: it is decompiled lazily
+                    varcInstancer = VarStoreInstancer(
+                        varcTable.VarStore, fvarAxes, normLocation
+                    )
+                else:
+                    # All deltas are zero at the default location
+                    varcInstancer = None
                 for (x, y), gc, vc in zip(
                     componentOffsets, g.components, varComponents
                 ):
@@ -64,16 +82,41 @@ class TTVarCFont:
                         vc.transform, varcInstancer, vc.numIntBitsForScale
                     )
                     tPen = TransformPen(pen, _makeTransform(x, y, transform))
-                    self.drawGlyph(tPen, gc.glyphName, componentLocation)
+                    self._drawGlyph(
+                        tPen,
+                        gc.glyphName,
+                        componentLocation,
+                        fvarAxes,
+                        glyfTable,
+                        glyphData,
+                        varcTable,
+                    )
             else:
                 for (x, y), gc in zip(componentOffsets, g.components):
                     tPen = TransformPen(pen, (1, 0, 0, 1, x, y))
-                    self.drawGlyph(tPen, gc.glyphName, {})
+                    self._drawGlyph(
+                        tPen,
+                        gc.glyphName,
+                        {},
+                        fvarAxes,
+                        glyfTable,
+                        glyphData,
+                        varcTable,
+                    )
         else:
             glyphID = self.ttFont.getGlyphID(glyphName)
             self.hbFont.set_variations(location)
             self.hbFont.draw_glyph_with_pen(glyphID, pen)
 
+    def _normalizeLocation(self, locationKey):
+        normLocation = normalizeLocation(dict(locationKey), self.axes)
+        return normLocation, tuplifyLocation(normLocation)
+
+    def _instantiateComponentOffsets(self, glyphName, normLocationKey):
+        return instantiateComponentOffsets(
+            self.ttFont, glyphName, dict(normLocationKey)
+        )
+
 
 def instantiateComponentOffsets(ttFont, glyphName, location):
     glyfTable = ttFont["glyf"]
@@ -92,12 +135,17 @@ def instantiateComponentOffsets(ttFont, glyphName, location):
                 origCoords, g = glyfTable.getCoordinatesAndControls(glyphName, ttFont)
                 endPts = g.endPts
             delta = iup_delta(delta, origCoords, endPts)
-        coordinates += GlyphCoordinates(delta) * scalar
+        # Scale the fresh delta array in place, instead of creating another one
+        delta = GlyphCoordinates(delta)
+        delta *= scalar
+        coordinates += delta
     assert len(coordinates) == len(glyfTable[glyphName].components) + 4
     return coordinates[:-4]
 
 
 def unpackComponentLocation(coordDict, varcInstancer):
+    if varcInstancer is None:
+        return {axis: valueDict["value"] for axis, valueDict in coordDict.items()}
     componentLocation = {}
     for axis, valueDict in coordDict.items():
         value = valueDict["value"]
@@ -109,6 +157,8 @@ def unpackComponentLocation(coordDict, varcInstancer):
 
 
 def unpackComponentTransform(transformDict, varcInstancer, numIntBitsForScale):
+    if varcInstancer is None:
+        return {name: valueDict["value"] for name, valueDict in transformDict.items()}
     transform = {}
     for name, valueDict in transformDict.items():
         value = valueDict["value"]
@@ -1,3 +1,4 @@
+import functools
 import math
 from fontTools.misc.transform import Transform
 
@@ -12,16 +13,58 @@ def makeTransform(x, y, rotation, scalex, scaley, tcenterx, tcentery):
     return t
 
 
+# Only a handful of distinct angles occur in a font, so the trigonometry for
+# them is memoized
+
+
+@functools.lru_cache(maxsize=1024)
+def _cosSinDegrees(angle):
+    angle = math.radians(angle)
+    return _snapSinCos(math.cos(angle)), _snapSinCos(math.sin(angle))
+
+
+_SIN_COS_EPSILON = 1e-15
+
+
+def _snapSinCos(v):
+    # Like Transform.rotate(), snap values that are within rounding error of
+    # 0, 1 or -1, so that for example a 90 degree rotation has exact zeros
+    if abs(v) < _SIN_COS_EPSILON:
+        return 0
+    elif v > 1 - _SIN_COS_EPSILON:
+        return 1
+    elif v < -1 + _SIN_COS_EPSILON:
+        return -1
+    return v
+
+
+@functools.lru_cache(maxsize=1024)
+def _tanDegrees(angle):
+    return math.tan(math.radians(angle))
+
+
 def makeTransformVarCo(
     x, y, rotation, scalex, scaley, skewx, skewy, tcenterx, tcentery
 ):
-    t = Transform()
-    t = t.translate(x + tcenterx, y + tcentery)
-    t = t.rotate(math.radians(rotation))
-    t = t.scale(scalex, scaley)
-    t = t.skew(math.radians(skewx), math.radians(skewy))
-    t = t.translate(-tcenterx, -tcentery)
-    return t
+    # This is the closed form of:
+    #   t = Transform()
+    #   t = t.translate(x + tcenterx, y + tcentery)
+    #   t = t.rotate(math.radians(rotation))
+    #   t = t.scale(scalex, scaley)
+    #   t = t.skew(math.radians(skewx), math.radians(skewy))
+    #   t = t.translate(-tcenterx, -tcentery)
+    # computing the matrix in one go instead of creating five Transform objects
+    cos, sin = _cosSinDegrees(rotation)
+    tanx = _tanDegrees(skewx)
+    tany = _tanDegrees(skewy)
+    xx = scalex * cos
+    xy = scalex * sin
+    yx = -scaley * sin
+    yy = scaley * cos
+    xx, xy, yx, yy = xx + tany * yx, xy + tany * yy, tanx * xx + yx, tanx * xy + yy
+    dx = xx * -tcenterx + yx * -tcentery + (x + tcenterx)
+    dy = xy * -tcenterx + yy * -tcentery + (y + tcentery)
+    return Transform(xx, xy, yx, yy, dx, dy)
 
 
 def recenterTransform(
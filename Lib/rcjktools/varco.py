@@ -1,11 +1,23 @@
+import functools
 from fontTools.designspaceLib import DesignSpaceDocument
 from fontTools.pens.pointPen import PointToSegmentPen
-from fontTools.varLib.models import VariationModel, allEqual, normalizeLocation
+from fontTools.varLib.models import allEqual, normalizeLocation
 from ufoLib2 import Font as UFont
-from .objects import Component, Glyph, MathDict
+from .objects import Component, Glyph, MathDict, getVariationModel
 from .utils import makeTransformVarCo, tuplifyLocation
 
 
+_transformFieldDefaults = [
+    ("rotation", 0),
+    ("scalex", 1),
+    ("scaley", 1),
+    ("skewx", 0),
+    ("skewy", 0),
+    ("tcenterx", 0),
+    ("tcentery", 0),
+]
+
+
 class VarCoGlyph(Glyph):
     @classmethod
     def loadFromUFOs(cls, ufos, locations, glyphName, axes):
@@ -53,17 +65,9 @@ class VarCoGlyph(Glyph):
                 x, y = affine[4:]
                 coord = vcCompo["coord"]
                 transformDict = vcCompo["transform"]
-                transform = MathDict(
-                    x=affine[4],
-                    y=affine[5],
-                    rotation=transformDict.get("rotation", 0),
-                    scalex=transformDict.get("scalex", 1),
-                    scaley=transformDict.get("scaley", 1),
-                    skewx=transformDict.get("skewx", 0),
-                    skewy=transformDict.get("skewy", 0),
-                    tcenterx=transformDict.get("tcenterx", 0),
-                    tcentery=transformDict.get("tcentery", 0),
-                )
+                transform = MathDict(x=x, y=y)
+                for fieldName, defaultValue in _transformFieldDefaults:
+                    transform[fieldName] = transformDict.get(fieldName, defaultValue)
             self.components.append(Component(baseGlyph, MathDict(coord), transform))
 
         assert len(self.variations) == 0
@@ -80,7 +84,7 @@ class VarCoGlyph(Glyph):
                 self.variations.append(varGlyph)
             if self.variations:
                 locations = [{}] + [variation.location for variation in self.variations]
-                self.model = VariationModel(locations)
+                self.model = getVariationModel(locations)
 
 
 class VarCoFont:
@@ -88,22 +92,56 @@ class VarCoFont:
         doc = DesignSpaceDocument.fromfile(designSpacePath)
         self.axes, self.ufos, self.locations = unpackDesignSpace(doc)
         self.varcoGlyphs = {}
+        # Components are drawn at the same locations over and over again
+        self._getGlyphInstance = functools.lru_cache(maxsize=4096)(
+            self._instantiateGlyph
+        )
+        # Whole glyphs are typically redrawn at a handful of locations
+        self._getFlattenedGlyph = functools.lru_cache(maxsize=256)(self._flattenGlyph)
 
     def drawGlyph(self, pen, glyphName, location):
         self.drawPointsGlyph(PointToSegmentPen(pen), glyphName, location)
 
     def drawPointsGlyph(self, pen, glyphName, location, transform=None):
-        varGlyph = self[glyphName]
-        instanceGlyph = varGlyph.instantiate(location)
-        outline = instanceGlyph.outline
-        if transform is not None:
-            outline = outline.transform(transform)
-        outline.drawPoints(pen)
-        for component in instanceGlyph.components:
-            t = makeTransformVarCo(**component.transform)
+        outlines = self._getFlattenedGlyph(glyphName, tuplifyLocation(location))
+        for outline in outlines:
             if transform is not None:
-                t = transform.transform(t)
-            self.drawPointsGlyph(pen, component.name, component.coord, t)
+                outline = outline.transform(transform)
+            outline.drawPoints(pen)
+
+    def _flattenGlyph(self, glyphName, locationKey):
+        # Walk the component tree with a stack instead of recursing, and
+        # collect the leaf outlines with their final transform applied. The
+        # components are pushed in reverse, so they come out in drawing order.
+        outlines = []
+        stack = [(glyphName, dict(locationKey), None)]
+        while stack:
+            glyphName, location, transform = stack.pop()
+            outline, components = self._getGlyphInstance(
+                glyphName, tuplifyLocation(location)
+            )
+            if transform is not None:
+                outline = outline.transform(transform)
+            outlines.append(outline)
+            for componentName, componentLocation, t in reversed(components):
+                if transform is not None:
+                    t = transform.transform(t)
+                stack.append((componentName, componentLocation, t))
+        return outlines
+
+    def _instantiateGlyph(self, glyphName, locationKey):
+        # Also build the component transforms here, so they get cached along
+        # with the instance instead of being recomputed on every draw
+        instanceGlyph = self[glyphName].instantiate(dict(locationKey))
+        components = [
+            (
+                component.name,
+                component.coord,
+                makeTransformVarCo(**component.transform),
+            )
+            for component in instanceGlyph.components
+        ]
+        return instanceGlyph.outline, components
 
     def keys(self):
         return self.ufos[0].keys()
@@ -135,12 +173,19 @@ class VarCoFont:
 
     def extractVarCoData(self, globalAxisNames, neutralOnly=False):
         allLocations = set()
+        # The master location dicts are shared between glyphs, so only
+        # tuplify each of them once. The dicts are kept as the values, so
+        # that their ids can't be reused while we're looping.
+        seenLocations = {}
         vcData = {}
         neutralGlyphNames = []
         for glyphName in sorted(self.keys()):
             glyph = self[glyphName]
-            axisTags = {axisTag for v in glyph.variations for axisTag in v.location}
-            if neutralOnly and not axisTags - globalAxisNames:
+            if neutralOnly and all(
+                axisTag in globalAxisNames
+                for v in glyph.variations
+                for axisTag in v.location
+            ):
                 masters = [glyph]
                 neutralGlyphNames.append(glyphName)
             else:
@@ -167,20 +212,24 @@ class VarCoFont:
                 continue
 
             locations = [m.location for m in masters]
-            allLocations.update(tuplifyLocation(loc) for loc in locations)
+            for loc in locations:
+                if id(loc) not in seenLocations:
+                    seenLocations[id(loc)] = loc
+                    allLocations.add(tuplifyLocation(loc))
             components = []
+            fieldMappingItems = _transformFieldMapping.items()
+            masterComponentLists = [m.components for m in masters]
             for i in range(len(glyph.components)):
-                assert allEqual([m.components[i].name for m in masters])
-                coords = [m.components[i].coord for m in masters]
+                masterComponents = [
+                    componentList[i] for componentList in masterComponentLists
+                ]
+                assert allEqual([c.name for c in masterComponents])
+                coords = [c.coord for c in masterComponents]
                 fillMissingFromNeutral(coords)
                 transforms = [
-                    # Filter out x and y, as they'll be in glyf and gvar
-                    {
-                        _transformFieldMapping[k]: v
-                        for k, v in m.components[i].transform.items()
-                        if k not in {"x", "y"}
-                    }
-                    for m in masters
+                    # Leave out x and y, as they'll be in glyf and gvar
+                    {fieldName: c.transform[k] for k, fieldName in fieldMappingItems}
+                    for c in masterComponents
                 ]
                 components.append(list(zip(coords, transforms)))
             if components:
@@ -225,7 +274,8 @@ def unpackDesignSpace(doc):
         locations.append(loc)
         ufo = _loaded.get(src.path)
         if ufo is None:
-            ufo = UFont.open(src.path)
+            # Lazy: only the glyphs that get drawn are parsed
+            ufo = UFont.open(src.path, lazy=True)
             _loaded[src.path] = ufo
         if src.layerName is None:
             ufo.layers.defaultLayer
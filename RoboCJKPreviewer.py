@@ -1,7 +1,8 @@
+import functools
 import sys
 import os
 import objc
-from AppKit import NSFormatter
+from AppKit import NSFormatter, NSRunLoop, NSRunLoopCommonModes, NSTimer
 from vanilla import *
 
 import drawBot as db
@@ -42,11 +43,18 @@ class UnicodesFormatter(NSFormatter, metaclass=ClassNameIncrementer):
 class RoboCJKPreviewer:
     def __init__(self, rcjkProjectPath):
         self.project = RoboCJKProject(rcjkProjectPath, decomposeClassicComponents=True)
+        # Moving the slider back and forth revisits the same locations
+        self._getCharacterGlyphInstance = functools.lru_cache(maxsize=512)(
+            self._instantiateCharacterGlyph
+        )
         self.glyphList = [
             dict(glyphName=glyphName, unicode=unicodes)
             for glyphName, unicodes in self.project.getGlyphNamesAndUnicodes().items()
         ]
         self.glyphList.sort(key=lambda item: (item["unicode"], item["glyphName"]))
+        self._glyphListLower = [
+            (item, item["glyphName"].lower()) for item in self.glyphList
+        ]
 
         self.w = Window(
             (1000, 400),
@@ -101,20 +109,38 @@ class RoboCJKPreviewer:
             selectionCallback=self.atomicElementListSelectionChangedCallback,
         )
 
+        self._displayedGlyphList = self.glyphList
+        self._lastFindPattern = ""
+        self._lastFindMatches = self._glyphListLower
+        self._currentWeight = None
+        self._drawingState = None
+        self._sliderTimer = None
+
         self.w.dbView = DrawView((600, 0, 0, 0))  # The DrawBot PDF view
         self.w.characterGlyphList.setSelection([])
         self.w.open()
 
     def findGlyphFieldCallback(self, sender):
         pat = sender.get().lower()
-        if not pat:
-            self.w.characterGlyphList.set(self.glyphList)
+        if pat.startswith(self._lastFindPattern):
+            # The search got narrower: only the previous matches can match
+            candidates = self._lastFindMatches
         else:
-            items = [
-                item for item in self.glyphList if pat in item["glyphName"].lower()
-            ]
+            candidates = self._glyphListLower
+        matches = [
+            (item, nameLower) for item, nameLower in candidates if pat in nameLower
+        ]
+        self._lastFindPattern = pat
+        self._lastFindMatches = matches
+        items = [item for item, nameLower in matches]
+        # Reloading the table is what's slow: don't if the rows are the same
+        if items != self._displayedGlyphList:
+            self._displayedGlyphList = items
             self.w.characterGlyphList.set(items)
-        self.w.characterGlyphList.setSelection([])
+        # Clearing an already empty selection would still fire the selection
+        # callback, and redraw for nothing
+        if self.w.characterGlyphList.getSelection():
+            self.w.characterGlyphList.setSelection([])
 
     def characterGlyphListSelectionChangedCallback(self, sender):
         self.updateCurrentGlyph()
@@ -127,6 +153,7 @@ class RoboCJKPreviewer:
         self.w.atomicElementList.setSelection([])
 
     def updateCurrentGlyph(self):
+        self._currentWeight = quantizeSliderValue(self.w.axisSlider.get())
         sel = self.w.characterGlyphList.getSelection()
         if sel:
             glyphName = self.w.characterGlyphList[sel[0]]["glyphName"]
@@ -135,9 +162,7 @@ class RoboCJKPreviewer:
                 dcItems,
                 classicComponents,
                 width,
-            ) = self.project.instantiateCharacterGlyph(
-                glyphName, location={"wght": self.w.axisSlider.get()}
-            )
+            ) = self._getCharacterGlyphInstance(glyphName, self._currentWeight)
             assert not classicComponents
         else:
             outline = None
@@ -145,6 +170,11 @@ class RoboCJKPreviewer:
         self._currentGlyphOutline = outline
         self._currentGlyphComponents = dcItems
 
+    def _instantiateCharacterGlyph(self, glyphName, wght):
+        return self.project.instantiateCharacterGlyph(
+            glyphName, location={"wght": wght}
+        )
+
     def deepComponentListSelectionChangedCallback(self, sender):
         sel = sender.getSelection()
         if sel:
@@ -156,13 +186,41 @@ class RoboCJKPreviewer:
         self.w.atomicElementList.setSelection([])
 
     def atomicElementListSelectionChangedCallback(self, sender):
-        self.drawCurrentGlyph()
-        self.displayDrawing()
+        self.redrawIfNeeded()
 
     def axisSliderCallback(self, sender):
+        if quantizeSliderValue(sender.get()) == self._currentWeight:
+            # The slider moved less than a quantization step
+            return
+        # Dragging the slider fires many more events than can be drawn:
+        # redraw at most once per frame, with the latest slider value
+        if self._sliderTimer is None:
+            self._sliderTimer = NSTimer.timerWithTimeInterval_repeats_block_(
+                1 / 60, False, self._sliderTimerFired
+            )
+            # Common modes, so the timer also fires while the slider is tracking
+            NSRunLoop.currentRunLoop().addTimer_forMode_(
+                self._sliderTimer, NSRunLoopCommonModes
+            )
+
+    def _sliderTimerFired(self, timer):
+        self._sliderTimer = None
         self.updateCurrentGlyph()
-        self.drawCurrentGlyph()
-        self.displayDrawing()
+        self.redrawIfNeeded()
+
+    def redrawIfNeeded(self):
+        # Glyph instances are cached, so an unchanged glyph and weight give the
+        # very same outline objects: then only the list selections can differ
+        drawingState = (
+            self._currentGlyphOutline,
+            self._currentGlyphComponents,
+            self.w.deepComponentList.getSelection(),
+            self.w.atomicElementList.getSelection(),
+        )
+        if drawingState != self._drawingState:
+            self._drawingState = drawingState
+            self.drawCurrentGlyph()
+            self.displayDrawing()
 
     def drawCurrentGlyph(self):
         db.newDrawing()
@@ -203,6 +261,11 @@ class RoboCJKPreviewer:
         self.w.dbView.setPDFDocument(context.getNSPDFDocument())
 
 
+def quantizeSliderValue(value):
+    # Snap to 1/256 steps, so that slider jitter hits the instance cache
+    return round(value * 256) / 256
+
+
 def drawOutline(outline):
     bez = db.BezierPath()
     outline.drawPoints(bez)
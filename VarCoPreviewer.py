@@ -1,8 +1,9 @@
+import functools
 import importlib
 import sys
 import os
 import objc
-from AppKit import NSFormatter
+from AppKit import NSFormatter, NSRunLoop, NSRunLoopCommonModes, NSTimer
 from vanilla import *
 
 from fontTools.ttLib import TTFont, registerCustomTableClass
@@ -22,6 +23,8 @@ except ImportError:
     assert libPath not in sys.path
     sys.path.append(libPath)
 
+registerCustomTableClass("VarC", "rcjktools.table_VarC", "table_VarC")
+
 
 def ClassNameIncrementer(clsName, bases, dct):
     orgName = clsName
@@ -79,7 +82,13 @@ class VarCoPreviewer:
         else:
             assert 0, "unsupported file type"
 
+        # Scrubbing the sliders and reselecting glyphs revisits the same paths
+        self._getGlyphPath = functools.lru_cache(maxsize=512)(self._drawGlyphPath)
+
         self.glyphList = sorted(self.varcoFont.keys())
+        self._glyphListLower = [
+            (glyphName, glyphName.lower()) for glyphName in self.glyphList
+        ]
 
         self.w = Window(
             (1000, 400),
@@ -93,7 +102,7 @@ class VarCoPreviewer:
         )
 
         y = 8
-        self.axisSliderMapping = []
+        self.axisSliders = []
         for axisIndex, (axisTag, minValue, defaultValue, maxValue) in enumerate(
             axisInfo
         ):
@@ -111,7 +120,7 @@ class VarCoPreviewer:
             y += 30
             setattr(self.w, axisLabelAttrName, label)
             setattr(self.w, axisSliderAttrName, slider)
-            self.axisSliderMapping.append((axisSliderAttrName, axisTag))
+            self.axisSliders.append((axisTag, slider))
 
         top = 40
         self.w.characterGlyphList = List(
@@ -124,44 +133,92 @@ class VarCoPreviewer:
             selectionCallback=self.characterGlyphListSelectionChangedCallback,
         )
 
+        self._displayedGlyphList = self.glyphList
+        self._lastFindPattern = ""
+        self._lastFindMatches = self._glyphListLower
+        self._currentLocation = None
+        self._currentGlyphPath = None
+        self._drawnGlyphPath = False  # Not even the empty drawing yet
+        self._sliderTimer = None
+
         self.w.dbView = DrawView((200, 0, -220, 0))  # The DrawBot PDF view
         self.w.characterGlyphList.setSelection([])
         self.w.open()
 
     def findGlyphFieldCallback(self, sender):
         pat = sender.get().lower()
-        if not pat:
-            self.w.characterGlyphList.set(self.glyphList)
+        if pat.startswith(self._lastFindPattern):
+            # The search got narrower: only the previous matches can match
+            candidates = self._lastFindMatches
         else:
-            items = [item for item in self.glyphList if pat in item.lower()]
+            candidates = self._glyphListLower
+        matches = [
+            (item, nameLower) for item, nameLower in candidates if pat in nameLower
+        ]
+        self._lastFindPattern = pat
+        self._lastFindMatches = matches
+        items = [item for item, nameLower in matches]
+        # Reloading the table is what's slow: don't if the rows are the same
+        if items != self._displayedGlyphList:
+            self._displayedGlyphList = items
             self.w.characterGlyphList.set(items)
-        self.w.characterGlyphList.setSelection([])
+        # Clearing an already empty selection would still fire the selection
+        # callback, and redraw for nothing
+        if self.w.characterGlyphList.getSelection():
+            self.w.characterGlyphList.setSelection([])
 
     def characterGlyphListSelectionChangedCallback(self, sender):
         self.updateCurrentGlyph()
-        self.drawCurrentGlyph()
-        self.displayDrawing()
+        self.redrawIfNeeded()
 
     def updateCurrentGlyph(self):
+        self._currentLocation = self.getSliderLocation()
         sel = self.w.characterGlyphList.getSelection()
         if sel:
-            location = {}
-            for sliderAttrName, axisTag in self.axisSliderMapping:
-                location[axisTag] = getattr(self.w, sliderAttrName).get()
             glyphName = self.w.characterGlyphList[sel[0]]
-            self._currentGlyphPath = BezierPath()
-            self.varcoFont.drawGlyph(
-                self._currentGlyphPath,
-                glyphName,
-                location,
+            self._currentGlyphPath = self._getGlyphPath(
+                glyphName, tuple(self._currentLocation.items())
             )
         else:
             self._currentGlyphPath = None
 
+    def _drawGlyphPath(self, glyphName, locationKey):
+        glyphPath = BezierPath()
+        self.varcoFont.drawGlyph(glyphPath, glyphName, dict(locationKey))
+        return glyphPath
+
+    def getSliderLocation(self):
+        return {
+            axisTag: quantizeSliderValue(slider.get())
+            for axisTag, slider in self.axisSliders
+        }
+
     def axisSliderCallback(self, sender):
+        if self.getSliderLocation() == self._currentLocation:
+            return
+        # Dragging the slider fires many more events than can be drawn:
+        # redraw at most once per frame, with the latest slider value
+        if self._sliderTimer is None:
+            self._sliderTimer = NSTimer.timerWithTimeInterval_repeats_block_(
+                1 / 60, False, self._sliderTimerFired
+            )
+            # Common modes, so the timer also fires while the slider is tracking
+            NSRunLoop.currentRunLoop().addTimer_forMode_(
+                self._sliderTimer, NSRunLoopCommonModes
+            )
+
+    def _sliderTimerFired(self, timer):
+        self._sliderTimer = None
         self.updateCurrentGlyph()
-        self.drawCurrentGlyph()
-        self.displayDrawing()
+        self.redrawIfNeeded()
+
+    def redrawIfNeeded(self):
+        # Glyph paths are cached, so an unchanged glyph and location give the
+        # very same path object: no need to render the PDF again
+        if self._currentGlyphPath is not self._drawnGlyphPath:
+            self._drawnGlyphPath = self._currentGlyphPath
+            self.drawCurrentGlyph()
+            self.displayDrawing()
 
     def drawCurrentGlyph(self):
         db.newDrawing()
@@ -186,6 +243,11 @@ class VarCoPreviewer:
         self.w.dbView.setPDFDocument(context.getNSPDFDocument())
 
 
+def quantizeSliderValue(value):
+    # Snap to 1/256 steps, so that slider jitter hits the glyph path cache
+    return round(value * 256) / 256
+
+
 def getWeightRange(ttFont):
     minWeight = 0
     maxWeight = 1
@@ -244,8 +306,6 @@ class COLRFont:
 if __name__ == "__main__":
     from vanilla.dialogs import getFileOrFolder
 
-    registerCustomTableClass("VarC", "rcjktools.table_VarC", "table_VarC")
-
     result = getFileOrFolder(
         "Please select a VarCo .designspace, .ttf or .rcjk project",
         fileTypes=["designspace", "ttf", "rcjk"],